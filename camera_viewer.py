@@ -1,20 +1,322 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import cv2
-from PIL import Image, ImageTk
+import numpy as np
 import threading
+import concurrent.futures
 import os
 from datetime import datetime
 from dotenv import load_dotenv
-from pymodbus.client import ModbusSerialClient
+from pymodbus.client import AsyncModbusSerialClient
 import serial
+import serial_asyncio
+import asyncio
 import re
-import time
+from dataclasses import dataclass
+
+try:
+    import av
+except ImportError:
+    av = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# NVDEC decoders keyed by the stream's codec name
+CUVID_DECODERS = {"h264": "h264_cuvid", "hevc": "hevc_cuvid"}
+
+
+def nvdec_available():
+    """Whether an NVDEC decoder can be opened here, i.e. FFmpeg has cuvid and a GPU/driver is present"""
+    for name in CUVID_DECODERS.values():
+        if name in av.codecs_available:
+            try:
+                # Opening with no stream parameters still initialises CUDA and probes the decoder
+                av.CodecContext.create(name, "r").open()
+                return True
+            except Exception:
+                return False
+    return False
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def downscale_bgr_to_rgb(src, dst, x_map, y_map):
+        """Nearest-neighbour downscale and BGR->RGB swap in one pass over dst"""
+        for y in prange(dst.shape[0]):
+            row = src[y_map[y]]
+            for x in range(dst.shape[1]):
+                pixel = row[x_map[x]]
+                dst[y, x, 0] = pixel[2]
+                dst[y, x, 1] = pixel[1]
+                dst[y, x, 2] = pixel[0]
+else:
+    downscale_bgr_to_rgb = None
+
+# FFmpeg options for OpenCV's RTSP reader: TCP transport and no demuxer-side buffering
+OPENCV_FFMPEG_OPTIONS = "rtsp_transport;tcp|fflags;nobuffer|flags;low_delay|max_delay;0|reorder_queue_size;0"
+
+# Scales end ASCII frames with CR, LF or CRLF
+FRAME_TERMINATOR = re.compile(rb"[\r\n]")
+# A frame this long without a terminator is handed on as is
+MAX_FRAME_BYTES = 4096
+
+# Bytes allowed in the number following the sign of a Toledo-style weight line
+TOLEDO_NUMBER_BYTES = frozenset(b"0123456789.")
+
+
+def parse_toledo_weight(data):
+    """Parse the signed weight from a line such as b'ST,GS,+00123.45kg' or b'ST,GS,+  123.45kg' (plain decimals only)"""
+    start = data.find(b"+")
+    if start < 0:
+        start = data.find(b"-")
+        if start < 0:
+            return None
+    # Indicators pad the number with zeros or spaces after the sign
+    digits = start + 1
+    while digits < len(data) and data[digits] == 0x20:
+        digits += 1
+    end = digits
+    while end < len(data) and data[end] in TOLEDO_NUMBER_BYTES:
+        end += 1
+    # An exponent is not part of these formats; leave such lines to the regex
+    if end == digits or (end < len(data) and data[end] in b"eE"):
+        return None
+    try:
+        value = float(data[digits:end])
+    except ValueError:
+        return None
+    return -value if data[start] == 0x2D else value
+
+
+def getenv_typed(name, cast, default, errors=None):
+    """Read an environment variable and convert it, using default when unset (or invalid, noted in errors)"""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        return cast(value.strip())
+    except ValueError:
+        if errors is None:
+            raise
+        errors.append(f"invalid {name}={value!r}")
+        return default
+
+
+def build_camera_url(camera_num):
+    """Build camera URL from environment variables"""
+    # Check if full RTSP URL is provided
+    rtsp_url = os.getenv(f"CAMERA{camera_num}_RTSP_URL")
+    if rtsp_url:
+        return rtsp_url
+    
+    # Build URL from individual components
+    ip = os.getenv(f"CAMERA{camera_num}_IP", "192.168.1.100" if camera_num == 1 else "192.168.1.101")
+    username = os.getenv(f"CAMERA{camera_num}_USERNAME", "admin")
+    password = os.getenv(f"CAMERA{camera_num}_PASSWORD", "password")
+    port = os.getenv(f"CAMERA{camera_num}_PORT", "554")
+    stream_path = os.getenv(f"CAMERA{camera_num}_STREAM_PATH", "stream1")
+    
+    return f"rtsp://{username}:{password}@{ip}:{port}/{stream_path}"
+
+
+@dataclass(frozen=True)
+class Config:
+    """Settings read from the environment (.env) once at startup"""
+    camera1_url: str
+    camera2_url: str
+    hwaccel: str
+    hw_resize: bool
+    weighbridge_port: str
+    weighbridge_baudrate: str
+    weighbridge_protocol: str
+    weighbridge_parity: str
+    weighbridge_bytesize: int
+    weighbridge_stopbits: float
+    weighbridge_timeout: float
+    weighbridge_address: int
+    weighbridge_count: int
+    weighbridge_slave_id: int
+    weighbridge_kind: str
+    weighbridge_divisor: float
+    weighbridge_format: str
+    weighbridge_regex: str
+    weighbridge_unit: str
+    weighbridge_decimals: str
+    # Invalid weighbridge settings, reported when connecting so the cameras still start
+    weighbridge_errors: tuple = ()
+
+    @classmethod
+    def from_env(cls):
+        """Build the configuration; serial defaults depend on the weighbridge protocol"""
+        protocol = getenv_typed("WEIGHBRIDGE_PROTOCOL", str.lower, "modbus")
+        ascii_mode = protocol == "ascii"
+        errors = []
+        # Register settings only matter to Modbus; for ASCII a bad value is not worth refusing to connect
+        modbus_errors = [] if ascii_mode else errors
+        return cls(
+            camera1_url=build_camera_url(1),
+            camera2_url=build_camera_url(2),
+            # Hardware decoder: cuda, vaapi or none (OpenCV software decode)
+            hwaccel=getenv_typed("CAMERA_HWACCEL", str.lower, "cuda"),
+            # Scale frames to the display size inside the decoder (captures are then display-sized too)
+            hw_resize=getenv_typed("CAMERA_HW_RESIZE", lambda v: v.lower() in ("1", "true", "yes"), False),
+            weighbridge_port=os.getenv("WEIGHBRIDGE_PORT", "/dev/ttyUSB0"),
+            weighbridge_baudrate=os.getenv("WEIGHBRIDGE_BAUDRATE", "9600"),
+            weighbridge_protocol=protocol,
+            weighbridge_parity=getenv_typed("WEIGHBRIDGE_PARITY", str.upper, "E" if ascii_mode else "N"),
+            weighbridge_bytesize=getenv_typed("WEIGHBRIDGE_BYTESIZE", int, 7 if ascii_mode else 8, errors),
+            weighbridge_stopbits=getenv_typed("WEIGHBRIDGE_STOPBITS", float, 1.0, errors),
+            weighbridge_timeout=getenv_typed("WEIGHBRIDGE_TIMEOUT", float, 0.5 if ascii_mode else 1.0, errors),
+            weighbridge_address=getenv_typed("WEIGHBRIDGE_ADDRESS", int, 0, modbus_errors),
+            weighbridge_count=getenv_typed("WEIGHBRIDGE_COUNT", int, 2, modbus_errors),
+            weighbridge_slave_id=getenv_typed("WEIGHBRIDGE_SLAVE_ID", int, 1, modbus_errors),
+            weighbridge_kind=getenv_typed("WEIGHBRIDGE_KIND", str.lower, "holding"),
+            weighbridge_divisor=getenv_typed("WEIGHBRIDGE_SCALE_DIVISOR", float, 1.0, errors),
+            weighbridge_format=getenv_typed("WEIGHBRIDGE_FORMAT", str.lower, "regex"),
+            weighbridge_regex=os.getenv("WEIGHBRIDGE_REGEX", r"([-+]?\d+(?:\.\d+)?)"),
+            weighbridge_unit=os.getenv("WEIGHBRIDGE_UNIT", "kg"),
+            weighbridge_decimals=getenv_typed("WEIGHBRIDGE_DECIMALS", str.lower, "auto"),
+            # Arguments are evaluated in order, so every reading above has been checked by now
+            weighbridge_errors=tuple(errors),
+        )
+
+
+class HwVideoCapture:
+    """Hardware-decoded RTSP reader exposing the cv2.VideoCapture methods we use"""
+
+    def __init__(self, url, hwaccel="cuda", display_size=None):
+        if av is None:
+            raise RuntimeError("PyAV is not installed")
+        # Fail before connecting to the stream, so the OpenCV fallback is the only RTSP open
+        if hwaccel == "cuda" and not nvdec_available():
+            raise RuntimeError("No usable NVDEC (cuvid) decoder")
+        self.hwaccel = hwaccel
+        self.container = av.open(url, options={"rtsp_transport": "tcp"})
+        try:
+            self.stream = self.container.streams.video[0]
+            # Size frames are scaled to before leaving the decoder; None keeps full resolution
+            self.output_size = self.fit_size(display_size) if display_size else None
+            self.codec_ctx = self.create_decoder()
+            self.packets = self.container.demux(self.stream)
+            self.frames = iter(())
+            self.wait_keyframe = False
+            self.grabbed = None
+            # Decode one frame now so a missing GPU/driver fails here, not in the stream thread
+            self.first_frame = self.next_frame()
+        except Exception:
+            self.container.close()
+            raise
+
+    def fit_size(self, display_size):
+        """Largest even frame size that fits display_size at the stream's aspect ratio"""
+        src = self.stream.codec_context
+        scale = min(display_size[0] / src.width, display_size[1] / src.height)
+        return int(src.width * scale) & ~1, int(src.height * scale) & ~1
+
+    def set_output_size(self, display_size):
+        """Rescale to a new display size, rebuilding the NVDEC scaler only if it changed"""
+        size = self.fit_size(display_size)
+        if size == self.output_size:
+            return
+        self.output_size = size
+        if self.hwaccel == "cuda":
+            self.codec_ctx = self.create_decoder()
+            self.frames = iter(())
+            # A fresh decoder cannot start mid-GOP
+            self.wait_keyframe = True
+
+    def create_decoder(self):
+        """Create a decoder context bound to the requested hardware"""
+        src = self.stream.codec_context
+        if self.hwaccel == "cuda":
+            name = CUVID_DECODERS.get(src.name)
+            if name is None:
+                raise RuntimeError(f"No NVDEC decoder for codec '{src.name}'")
+            ctx = av.CodecContext.create(name, "r")
+            if self.output_size:
+                # Scale in NVDEC so only the display-sized NV12 frame is copied off the GPU
+                ctx.options = {"resize": "%dx%d" % self.output_size}
+        elif self.hwaccel == "vaapi":
+            from av.codec.hwaccel import HWAccel
+            ctx = av.CodecContext.create(src.name, "r",
+                                         hwaccel=HWAccel(device_type="vaapi", allow_software_fallback=False))
+        else:
+            raise ValueError(f"Unsupported hardware decoder: {self.hwaccel}")
+        ctx.extradata = src.extradata
+        return ctx
+
+    def next_frame(self):
+        """Demux and decode until the next video frame is available"""
+        while True:
+            frame = next(self.frames, None)
+            if frame is not None:
+                return frame
+            packet = next(self.packets)
+            if self.wait_keyframe:
+                if not packet.is_keyframe:
+                    continue
+                self.wait_keyframe = False
+            self.frames = iter(self.codec_ctx.decode(packet))
+
+    def to_bgr(self, frame):
+        """Convert a decoded frame to a BGR ndarray at output_size"""
+        if self.output_size is None:
+            return frame.to_ndarray(format="bgr24")
+        if frame.format.name == "nv12" and (frame.width, frame.height) == self.output_size:
+            # Already scaled by NVDEC; convert the small NV12 frame only
+            return cv2.cvtColor(frame.to_ndarray(), cv2.COLOR_YUV2BGR_NV12)
+        # Scale and convert colour in a single swscale pass
+        width, height = self.output_size
+        return frame.to_ndarray(width=width, height=height, format="bgr24")
+
+    def grab(self):
+        """Decode the next frame and hold it for retrieve(), like cv2.VideoCapture.grab()"""
+        try:
+            if self.first_frame is not None:
+                self.grabbed, self.first_frame = self.first_frame, None
+            else:
+                self.grabbed = self.next_frame()
+            return True
+        except Exception:
+            self.grabbed = None
+            return False
+
+    def retrieve(self):
+        """Return (ret, frame) for the grabbed frame as a BGR ndarray"""
+        if self.grabbed is None:
+            return False, None
+        try:
+            return True, self.to_bgr(self.grabbed)
+        except Exception:
+            return False, None
+
+    def read(self):
+        """Return (ret, frame) with a BGR ndarray, like cv2.VideoCapture.read()"""
+        if not self.grab():
+            return False, None
+        return self.retrieve()
+
+    def set(self, prop_id, value):
+        """No capture properties apply to PyAV; report them as unsupported"""
+        return False
+
+    def isOpened(self):
+        return self.container is not None
+
+    def release(self):
+        if self.container is not None:
+            self.container.close()
+            self.container = None
+
 
 class CameraViewer:
     def __init__(self, root):
         # Load environment variables
         load_dotenv()
+        self.config = Config.from_env()
         
         self.root = root
         self.root.title("Dual IP Camera Viewer")
@@ -33,11 +335,26 @@ class CameraViewer:
         self.latest_frame2 = None
         self.frame_lock1 = threading.Lock()
         self.frame_lock2 = threading.Lock()
+        # Newest display frame per camera (guarded by frame_lockN); older ones are dropped
+        self.pending_display1 = None
+        self.pending_display2 = None
+        # Reused display images, recreated only when the frame size changes
+        self.photo1 = None
+        self.photo2 = None
+        self.photo1_size = None
+        self.photo2_size = None
+        # JPEG encoding for captures runs here instead of on the Tk main thread
+        self.io_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        # Display size per camera, refreshed on the UI thread by on_window_resize.
+        # Stream threads only read it; swapping the whole tuple keeps width/height consistent.
+        self.display_size = self.get_display_size(1200, 800)
+        # Source row/column maps for the Numba downscale, keyed by (source size, display size)
+        self.scale_maps = {}
         
         # Weighbridge connections
-        self.modbus_client = None
-        self.serial_conn = None
-        self.weighbridge_protocol = os.getenv("WEIGHBRIDGE_PROTOCOL", "modbus").strip().lower()
+        # Event loop and task of the weighbridge I/O thread
+        self.weight_loop = None
+        self.weight_task = None
         self.weight_value = "0.00"
         self.weight_unit = "kg"
         self.is_weight_connected = False
@@ -48,38 +365,23 @@ class CameraViewer:
         # Bind window close event
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         
-        # Bind window resize event to recalculate display sizes
-        self.root.bind("<Configure>", self.on_window_resize)
-    
-    def build_camera_url(self, camera_num):
-        """Build camera URL from environment variables"""
-        # Check if full RTSP URL is provided
-        rtsp_url = os.getenv(f"CAMERA{camera_num}_RTSP_URL")
-        if rtsp_url:
-            return rtsp_url
-        
-        # Build URL from individual components
-        ip = os.getenv(f"CAMERA{camera_num}_IP", "192.168.1.100" if camera_num == 1 else "192.168.1.101")
-        username = os.getenv(f"CAMERA{camera_num}_USERNAME", "admin")
-        password = os.getenv(f"CAMERA{camera_num}_PASSWORD", "password")
-        port = os.getenv(f"CAMERA{camera_num}_PORT", "554")
-        stream_path = os.getenv(f"CAMERA{camera_num}_STREAM_PATH", "stream1")
-        
-        return f"rtsp://{username}:{password}@{ip}:{port}/{stream_path}"
+        # Bind window resize event to recalculate display sizes. Child widgets share the
+        # root's bind tag, so filter on %W in Tcl to keep their events out of Python.
+        self.resize_after = None
+        resize_cmd = self.root.register(self.on_window_resize)
+        self.root.bind("<Configure>", f'if {{"%W" eq "{self.root}"}} {{{resize_cmd} %w %h}}')
+        
+        # Pull decoded frames into the UI at display rate
+        self.pump_displays()
     
     def connect_weighbridge(self):
         """Connect to weighbridge via Modbus or ASCII serial"""
         try:
             # Disconnect existing connection
-            if self.modbus_client:
-                self.modbus_client.close()
-                self.modbus_client = None
-            if self.serial_conn:
-                try:
-                    self.serial_conn.close()
-                except Exception:
-                    pass
-                self.serial_conn = None
+            self.stop_weight_io()
+            
+            if self.config.weighbridge_errors:
+                raise ValueError("; ".join(self.config.weighbridge_errors))
             
             port = self.weight_port.get().strip()
             baudrate = int(self.weight_baudrate.get().strip())
@@ -91,139 +393,200 @@ class CameraViewer:
             self.weight_status.config(text="Status: Connecting...", foreground="orange")
             self.root.update()
             
-            if self.weighbridge_protocol == "ascii":
+            config = self.config
+            if config.weighbridge_protocol == "ascii":
                 # Serial ASCII mode (e.g., many scales)
-                parity = os.getenv("WEIGHBRIDGE_PARITY", "E").strip().upper()
-                bytesize = int(os.getenv("WEIGHBRIDGE_BYTESIZE", "7").strip())
-                stopbits = float(os.getenv("WEIGHBRIDGE_STOPBITS", "1").strip())
-                timeout = float(os.getenv("WEIGHBRIDGE_TIMEOUT", "0.5").strip())
-
                 parity_map = {"N": serial.PARITY_NONE, "E": serial.PARITY_EVEN, "O": serial.PARITY_ODD}
                 bytesize_map = {7: serial.SEVENBITS, 8: serial.EIGHTBITS}
                 stopbits_map = {1: serial.STOPBITS_ONE, 1.5: serial.STOPBITS_ONE_POINT_FIVE, 2: serial.STOPBITS_TWO}
 
-                self.serial_conn = serial.Serial(
-                    port=port,
+                io_main = self.read_weight_ascii_loop(
+                    url=port,
                     baudrate=baudrate,
-                    bytesize=bytesize_map.get(bytesize, serial.SEVENBITS),
-                    parity=parity_map.get(parity, serial.PARITY_EVEN),
-                    stopbits=stopbits_map.get(stopbits, serial.STOPBITS_ONE),
-                    timeout=timeout,
+                    bytesize=bytesize_map.get(config.weighbridge_bytesize, serial.SEVENBITS),
+                    parity=parity_map.get(config.weighbridge_parity, serial.PARITY_EVEN),
+                    stopbits=stopbits_map.get(config.weighbridge_stopbits, serial.STOPBITS_ONE),
                 )
-
-                self.is_weight_connected = True
-                self.weight_status.config(text="Status: Connected (ASCII)", foreground="green")
-                threading.Thread(target=self.read_weight_ascii_loop, daemon=True).start()
             else:
                 # Modbus RTU mode
-                parity = os.getenv("WEIGHBRIDGE_PARITY", "N").strip().upper()
-                bytesize = int(os.getenv("WEIGHBRIDGE_BYTESIZE", "8").strip())
-                stopbits = int(float(os.getenv("WEIGHBRIDGE_STOPBITS", "1").strip()))
-                timeout = float(os.getenv("WEIGHBRIDGE_TIMEOUT", "1").strip())
-
-                self.modbus_client = ModbusSerialClient(
+                io_main = self.read_weight_loop(
                     method='rtu',
                     port=port,
                     baudrate=baudrate,
-                    timeout=timeout,
-                    parity=parity,
-                    stopbits=stopbits,
-                    bytesize=bytesize
+                    timeout=config.weighbridge_timeout,
+                    parity=config.weighbridge_parity,
+                    stopbits=int(config.weighbridge_stopbits),
+                    bytesize=config.weighbridge_bytesize
                 )
-                
-                # Connect to device
-                if self.modbus_client.connect():
-                    self.is_weight_connected = True
-                    self.weight_status.config(text="Status: Connected (Modbus)", foreground="green")
-                    
-                    # Start weight reading thread
-                    threading.Thread(target=self.read_weight_loop, daemon=True).start()
-                else:
-                    self.weight_status.config(text="Status: Connection Failed", foreground="red")
-                    messagebox.showerror("Error", f"Failed to connect to weighbridge on {port}")
+            
+            # Serial I/O runs on its own asyncio loop in a background thread; the task exists
+            # before the thread starts, so stop_weight_io() can always cancel it
+            self.is_weight_connected = True
+            self.weight_loop = asyncio.new_event_loop()
+            self.weight_task = self.weight_loop.create_task(io_main)
+            threading.Thread(target=self.run_weight_io, args=(self.weight_loop, self.weight_task), daemon=True).start()
                 
         except Exception as e:
             self.weight_status.config(text="Status: Error", foreground="red")
             messagebox.showerror("Error", f"Failed to connect to weighbridge: {str(e)}")
     
-    def read_weight_loop(self):
-        """Continuously read weight from weighbridge"""
-        while self.is_weight_connected and self.modbus_client:
+    def stop_weight_io(self):
+        """Cancel the running weighbridge coroutine; it closes its own port"""
+        self.is_weight_connected = False
+        if self.weight_task is not None:
             try:
-                # Read holding registers (address 0, count 2) - adjust as needed for your device
-                # Common addresses for weight scales: 0, 1, or 40001, 40002
-                address = int(os.getenv("WEIGHBRIDGE_ADDRESS", "0").strip())
-                count = int(os.getenv("WEIGHBRIDGE_COUNT", "2").strip())
-                unit = int(os.getenv("WEIGHBRIDGE_SLAVE_ID", "1").strip())
-                kind = os.getenv("WEIGHBRIDGE_KIND", "holding").strip().lower()
-
-                if kind == "input":
-                    result = self.modbus_client.read_input_registers(address=address, count=count, unit=unit)
-                else:
-                    result = self.modbus_client.read_holding_registers(address=address, count=count, unit=unit)
-                
-                if result.isError():
-                    print(f"Modbus error: {result}")
-                    time.sleep(1)
-                    continue
-                
-                # Basic conversion: assume integer value; apply optional scale divisor
-                raw = result.registers[0] if len(result.registers) > 0 else 0
-                divisor = float(os.getenv("WEIGHBRIDGE_SCALE_DIVISOR", "1").strip())
-                weight_value = float(raw) / (divisor if divisor != 0 else 1)
-                
-                # Update weight display in main thread
-                self.root.after(0, lambda: self.update_weight_display(weight_value))
-                
-                time.sleep(0.5)  # Read every 500ms
-                
-            except Exception as e:
-                print(f"Weight reading error: {e}")
-                time.sleep(1)
+                self.weight_loop.call_soon_threadsafe(self.weight_task.cancel)
+            except RuntimeError:
+                # Event loop already finished
+                pass
+        self.weight_loop = None
+        self.weight_task = None
+    
+    def run_weight_io(self, loop, task):
+        """Run one weighbridge coroutine to completion on its event loop (background thread)"""
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(task)
+        except asyncio.CancelledError:
+            # Cancelled before it started
+            pass
+        finally:
+            # Let transports finish closing their ports before the loop goes away
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+    
+    async def read_weight_loop(self, **client_kwargs):
+        """Continuously read weight from weighbridge"""
+        config = self.config
+        address = config.weighbridge_address
+        count = config.weighbridge_count
+        unit = config.weighbridge_slave_id
+        divisor = config.weighbridge_divisor if config.weighbridge_divisor != 0 else 1
+        client = AsyncModbusSerialClient(**client_kwargs)
+        if config.weighbridge_kind == "input":
+            read_registers = client.read_input_registers
+        else:
+            read_registers = client.read_holding_registers
+        
+        try:
+            # Connect to device
+            if not await client.connect():
+                self.root.after(0, self.set_weight_status, "Status: Connection Failed", "red")
+                self.root.after(0, messagebox.showerror, "Error", f"Failed to connect to weighbridge on {client_kwargs['port']}")
+                return
+            self.root.after(0, self.set_weight_status, "Status: Connected (Modbus)", "green")
+            
+            while self.is_weight_connected:
+                try:
+                    # Read registers configured in WEIGHBRIDGE_ADDRESS/COUNT/KIND
+                    # Common addresses for weight scales: 0, 1, or 40001, 40002
+                    result = await read_registers(address=address, count=count, unit=unit)
+                    
+                    if result.isError():
+                        print(f"Modbus error: {result}")
+                        await asyncio.sleep(1)
+                        continue
+                    
+                    # Basic conversion: assume integer value; apply optional scale divisor
+                    raw = result.registers[0] if len(result.registers) > 0 else 0
+                    weight_value = float(raw) / divisor
+                    
+                    # Update weight display in main thread
+                    self.root.after(0, self.update_weight_display, weight_value)
+                    
+                    await asyncio.sleep(0.5)  # Read every 500ms
+                    
+                except Exception as e:
+                    print(f"Weight reading error: {e}")
+                    await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            # Disconnected from the UI, which already shows the new status
+            return
+        finally:
+            client.close()
         
         # Connection lost
-        self.root.after(0, lambda: self.weight_status.config(text="Status: Disconnected", foreground="red"))
+        self.root.after(0, self.set_weight_status, "Status: Disconnected", "red")
 
-    def read_weight_ascii_loop(self):
+    async def read_weight_ascii_loop(self, **serial_kwargs):
         """Continuously read weight lines from ASCII serial device"""
-        line_regex = os.getenv("WEIGHBRIDGE_REGEX", r"([-+]?\d+(?:\.\d+)?)")
-        unit = os.getenv("WEIGHBRIDGE_UNIT", self.weight_unit)
-        decimals_env = os.getenv("WEIGHBRIDGE_DECIMALS", "auto").strip().lower()
-        divisor = float(os.getenv("WEIGHBRIDGE_SCALE_DIVISOR", "1").strip())
+        config = self.config
+        unit = config.weighbridge_unit
+        # Resolve the display precision once; "auto" (or an invalid value) shows 2 decimals
+        try:
+            decimals = int(config.weighbridge_decimals)
+        except ValueError:
+            decimals = 2
+        format_weight = ("{:.%df}" % (decimals if decimals >= 0 else 2)).format
+        divisor = config.weighbridge_divisor
+        # "toledo" parses the sign-prefixed number straight from bytes, using the regex only when that fails
+        toledo = config.weighbridge_format == "toledo"
+        # A frame without a terminator ends when the line goes quiet, like a timed-out readline
+        idle_timeout = config.weighbridge_timeout if config.weighbridge_timeout > 0 else None
 
-        pattern = re.compile(line_regex)
-        while self.is_weight_connected and self.serial_conn:
-            try:
-                data = self.serial_conn.readline()
-                if not data:
-                    continue
-                try:
-                    text = data.decode(errors='ignore').strip()
-                except Exception:
-                    continue
-                m = pattern.search(text)
-                if not m:
-                    continue
-                value_str = m.group(1)
+        pattern = re.compile(config.weighbridge_regex, re.ASCII)
+        try:
+            reader, writer = await serial_asyncio.open_serial_connection(**serial_kwargs)
+        except asyncio.CancelledError:
+            return
+        except Exception as e:
+            # Wrong port, busy or no permission: report it like a failed Modbus connect
+            self.root.after(0, self.set_weight_status, "Status: Error", "red")
+            self.root.after(0, messagebox.showerror, "Error", f"Failed to connect to weighbridge: {str(e)}")
+            return
+        try:
+            self.root.after(0, self.set_weight_status, "Status: Connected (ASCII)", "green")
+            
+            # Data arrives as the port becomes readable; no polling or retry sleeps
+            pending = b""
+            while self.is_weight_connected:
                 try:
-                    value = float(value_str)
-                except ValueError:
-                    continue
-                if divisor and divisor != 1:
-                    value = value / divisor
-                if decimals_env == "auto":
-                    display = f"{value:.2f}"
+                    chunk = await asyncio.wait_for(reader.read(MAX_FRAME_BYTES), idle_timeout)
+                except asyncio.TimeoutError:
+                    frames, pending = [pending], b""
                 else:
-                    try:
-                        decimals = int(decimals_env)
-                        display = f"{value:.{decimals}f}"
-                    except Exception:
-                        display = f"{value:.2f}"
-                self.root.after(0, lambda d=display, u=unit: self.weight_display.config(text=f"Weight: {d} {u}"))
-            except Exception:
-                time.sleep(0.2)
-                continue
-        self.root.after(0, lambda: self.weight_status.config(text="Status: Disconnected", foreground="red"))
+                    if not chunk:
+                        break
+                    *frames, pending = FRAME_TERMINATOR.split(pending + chunk)
+                    if len(pending) > MAX_FRAME_BYTES:
+                        frames.append(pending)
+                        pending = b""
+                for data in frames:
+                    if not data:
+                        continue
+                    value = parse_toledo_weight(data) if toledo else None
+                    if value is None:
+                        try:
+                            text = data.decode(errors='ignore').strip()
+                        except Exception:
+                            continue
+                        m = pattern.search(text)
+                        if not m:
+                            continue
+                        value_str = m.group(1)
+                        try:
+                            value = float(value_str)
+                        except ValueError:
+                            continue
+                    if divisor and divisor != 1:
+                        value = value / divisor
+                    self.root.after(0, self.set_weight_text, f"Weight: {format_weight(value)} {unit}")
+        except asyncio.CancelledError:
+            # Disconnected from the UI, which already shows the new status
+            return
+        except Exception as e:
+            print(f"Weight reading error: {e}")
+        finally:
+            writer.close()
+        self.root.after(0, self.set_weight_status, "Status: Disconnected", "red")
+    
+    def set_weight_status(self, text, color):
+        """Update weighbridge status label in main thread"""
+        self.weight_status.config(text=text, foreground=color)
+    
+    def set_weight_text(self, text):
+        """Update weight display text in main thread"""
+        self.weight_display.config(text=text)
     
     def update_weight_display(self, weight):
         """Update weight display in main thread"""
@@ -241,12 +604,12 @@ class CameraViewer:
         
         # Camera 1 URL input
         ttk.Label(input_frame, text="Camera 1 URL:").grid(row=0, column=0, sticky=tk.W, padx=(0, 5))
-        self.camera1_url = tk.StringVar(value=self.build_camera_url(1))
+        self.camera1_url = tk.StringVar(value=self.config.camera1_url)
         ttk.Entry(input_frame, textvariable=self.camera1_url, width=40).grid(row=0, column=1, padx=(0, 10))
         
         # Camera 2 URL input
         ttk.Label(input_frame, text="Camera 2 URL:").grid(row=0, column=2, sticky=tk.W, padx=(0, 5))
-        self.camera2_url = tk.StringVar(value=self.build_camera_url(2))
+        self.camera2_url = tk.StringVar(value=self.config.camera2_url)
         ttk.Entry(input_frame, textvariable=self.camera2_url, width=40).grid(row=0, column=3, padx=(0, 10))
         
         # Connect button
@@ -255,10 +618,10 @@ class CameraViewer:
         
         # Weighbridge settings
         ttk.Label(input_frame, text="Weighbridge:").grid(row=1, column=0, sticky=tk.W, padx=(0, 5), pady=(10, 0))
-        self.weight_port = tk.StringVar(value=os.getenv("WEIGHBRIDGE_PORT", "/dev/ttyUSB0"))
+        self.weight_port = tk.StringVar(value=self.config.weighbridge_port)
         ttk.Entry(input_frame, textvariable=self.weight_port, width=15).grid(row=1, column=1, padx=(0, 10), pady=(10, 0))
         
-        self.weight_baudrate = tk.StringVar(value=os.getenv("WEIGHBRIDGE_BAUDRATE", "9600"))
+        self.weight_baudrate = tk.StringVar(value=self.config.weighbridge_baudrate)
         ttk.Label(input_frame, text="Baud:").grid(row=1, column=2, sticky=tk.W, padx=(0, 5), pady=(10, 0))
         ttk.Entry(input_frame, textvariable=self.weight_baudrate, width=8).grid(row=1, column=3, padx=(0, 10), pady=(10, 0))
         
@@ -273,19 +636,27 @@ class CameraViewer:
         camera1_frame = ttk.LabelFrame(video_frame, text="Camera 1", padding=5)
         camera1_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
         
-        self.camera1_label = tk.Label(camera1_frame, text="Camera 1\nNot Connected", 
-                                    background="black", foreground="white", 
-                                    font=("Arial", 12))
-        self.camera1_label.pack(fill=tk.BOTH, expand=True)
+        # Canvas with persistent items: new frames only update the PhotoImage, no relayout
+        self.camera1_canvas = tk.Canvas(camera1_frame, background="black", highlightthickness=0)
+        self.camera1_image = self.camera1_canvas.create_image(0, 0)
+        self.camera1_text = self.camera1_canvas.create_text(0, 0, text="Camera 1\nNot Connected", 
+                                                              fill="white", font=("Arial", 12), 
+                                                              justify=tk.CENTER)
+        self.camera1_canvas.bind("<Configure>", self.center_camera_items)
+        self.camera1_canvas.pack(fill=tk.BOTH, expand=True)
         
         # Camera 2 display
         camera2_frame = ttk.LabelFrame(video_frame, text="Camera 2", padding=5)
         camera2_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(5, 0))
         
-        self.camera2_label = tk.Label(camera2_frame, text="Camera 2\nNot Connected", 
-                                    background="black", foreground="white", 
-                                    font=("Arial", 12))
-        self.camera2_label.pack(fill=tk.BOTH, expand=True)
+        # Canvas with persistent items: new frames only update the PhotoImage, no relayout
+        self.camera2_canvas = tk.Canvas(camera2_frame, background="black", highlightthickness=0)
+        self.camera2_image = self.camera2_canvas.create_image(0, 0)
+        self.camera2_text = self.camera2_canvas.create_text(0, 0, text="Camera 2\nNot Connected", 
+                                                              fill="white", font=("Arial", 12), 
+                                                              justify=tk.CENTER)
+        self.camera2_canvas.bind("<Configure>", self.center_camera_items)
+        self.camera2_canvas.pack(fill=tk.BOTH, expand=True)
         
         # Weight display frame (small overlay at bottom right)
         weight_frame = ttk.LabelFrame(main_frame, text="Weight Display", padding=10)
@@ -338,8 +709,8 @@ class CameraViewer:
             self.root.update()
             
             # Try to connect to cameras
-            self.cap1 = cv2.VideoCapture(url1)
-            self.cap2 = cv2.VideoCapture(url2)
+            self.cap1 = self.open_capture(url1)
+            self.cap2 = self.open_capture(url2)
             
             # Test camera connections
             ret1, frame1 = self.cap1.read()
@@ -364,14 +735,26 @@ class CameraViewer:
             self.capture_btn.config(state=tk.NORMAL)
             self.status_label.config(text="Status: Connected")
             
-            # Start video update threads
-            threading.Thread(target=self.update_camera1, daemon=True).start()
-            threading.Thread(target=self.update_camera2, daemon=True).start()
+            # Start video update thread
+            threading.Thread(target=self.update_cameras, daemon=True).start()
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to connect to cameras: {str(e)}")
             self.disconnect_cameras()
     
+    def open_capture(self, url):
+        """Open a stream on the configured hardware decoder, falling back to OpenCV"""
+        hwaccel = self.config.hwaccel
+        if hwaccel != "none":
+            try:
+                display_size = self.display_size if self.config.hw_resize else None
+                return HwVideoCapture(url, hwaccel, display_size)
+            except Exception as e:
+                print(f"Hardware decoding ({hwaccel}) unavailable, using OpenCV: {e}")
+        # Read by OpenCV when the capture opens; a value set in the environment wins
+        os.environ.setdefault("OPENCV_FFMPEG_CAPTURE_OPTIONS", OPENCV_FFMPEG_OPTIONS)
+        return cv2.VideoCapture(url)
+
     def disconnect_cameras(self):
         """Disconnect from cameras"""
         self.is_running = False
@@ -388,40 +771,32 @@ class CameraViewer:
         self.status_label.config(text="Status: Disconnected")
         
         # Clear video displays
-        self.camera1_label.config(text="Camera 1\nNot Connected", image="")
-        self.camera2_label.config(text="Camera 2\nNot Connected", image="")
+        self.camera1_canvas.itemconfigure(self.camera1_image, image="")
+        self.camera1_canvas.itemconfigure(self.camera1_text, text="Camera 1\nNot Connected")
+        self.camera2_canvas.itemconfigure(self.camera2_image, image="")
+        self.camera2_canvas.itemconfigure(self.camera2_text, text="Camera 2\nNot Connected")
+        self.photo1 = None
+        self.photo2 = None
         # Clear stored frames
         try:
             with self.frame_lock1:
                 self.latest_frame1 = None
+                self.pending_display1 = None
             with self.frame_lock2:
                 self.latest_frame2 = None
+                self.pending_display2 = None
         except Exception:
             pass
     
     def disconnect_weighbridge(self):
         """Disconnect from weighbridge"""
-        self.is_weight_connected = False
-        
-        if self.modbus_client:
-            self.modbus_client.close()
-            self.modbus_client = None
-        if self.serial_conn:
-            try:
-                self.serial_conn.close()
-            except Exception:
-                pass
-            self.serial_conn = None
+        self.stop_weight_io()
         
         self.weight_status.config(text="Status: Disconnected", foreground="red")
         self.weight_display.config(text="Weight: 0.00 kg")
     
-    def get_display_size(self):
-        """Get the available display size for video feeds"""
-        # Get the window size and calculate available space for video
-        window_width = self.root.winfo_width()
-        window_height = self.root.winfo_height()
-        
+    def get_display_size(self, window_width, window_height):
+        """Get the available display size for video feeds in a window of the given size"""
         # Account for other UI elements (approximate)
         # Input frame: ~60px, control frame: ~40px, padding: ~40px
         available_height = max(400, window_height - 140)
@@ -433,105 +808,142 @@ class CameraViewer:
         
         return camera_width, camera_height
     
-    def update_camera1(self):
-        """Update camera 1 video feed"""
-        while self.is_running and self.cap1:
-            try:
-                ret, frame = self.cap1.read()
-                if ret:
-                    # Store original frame for capture
-                    try:
-                        with self.frame_lock1:
-                            self.latest_frame1 = frame.copy()
-                    except Exception:
-                        pass
-                    # Get display size
-                    display_width, display_height = self.get_display_size()
-                    
-                    # Resize frame to fit display while maintaining aspect ratio
-                    frame_height, frame_width = frame.shape[:2]
-                    
-                    # Calculate scaling factor
-                    scale_w = display_width / frame_width
-                    scale_h = display_height / frame_height
-                    scale = min(scale_w, scale_h)
-                    
-                    # Resize frame
-                    new_width = int(frame_width * scale)
-                    new_height = int(frame_height * scale)
-                    frame = cv2.resize(frame, (new_width, new_height))
-                    
-                    # Convert to RGB
-                    frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    
-                    # Convert to PIL Image and then to PhotoImage
-                    image = Image.fromarray(frame)
-                    photo = ImageTk.PhotoImage(image)
-                    
-                    # Update label in main thread
-                    self.root.after(0, lambda: self.update_camera1_display(photo))
-                else:
-                    break
-            except Exception as e:
-                print(f"Camera 1 error: {e}")
-                break
-        
-        self.root.after(0, lambda: self.camera1_label.config(text="Camera 1\nConnection Lost"))
+    def update_cameras(self):
+        """Update both video feeds from a single thread"""
+        cameras = [(1, self.cap1), (2, self.cap2)]
+        while self.is_running and cameras:
+            # Grab both streams back to back so their frames are close in time,
+            # then decode and post-process them one after the other
+            grabbed = []
+            for num, cap in cameras:
+                try:
+                    grabbed.append(cap.grab())
+                except Exception as e:
+                    print(f"Camera {num} error: {e}")
+                    grabbed.append(False)
+            
+            for (num, cap), ok in zip(list(cameras), grabbed):
+                try:
+                    ret, frame = cap.retrieve() if ok else (False, None)
+                    if ret:
+                        ppm, size = self.prepare_display(cap, frame)
+                        self.publish_frame(num, frame, ppm, size)
+                        continue
+                except Exception as e:
+                    print(f"Camera {num} error: {e}")
+                cameras.remove((num, cap))
+                self.root.after(0, self.show_connection_lost, num)
     
-    def update_camera2(self):
-        """Update camera 2 video feed"""
-        while self.is_running and self.cap2:
-            try:
-                ret, frame = self.cap2.read()
-                if ret:
-                    # Store original frame for capture
-                    try:
-                        with self.frame_lock2:
-                            self.latest_frame2 = frame.copy()
-                    except Exception:
-                        pass
-                    # Get display size
-                    display_width, display_height = self.get_display_size()
-                    
-                    # Resize frame to fit display while maintaining aspect ratio
-                    frame_height, frame_width = frame.shape[:2]
-                    
-                    # Calculate scaling factor
-                    scale_w = display_width / frame_width
-                    scale_h = display_height / frame_height
-                    scale = min(scale_w, scale_h)
-                    
-                    # Resize frame
-                    new_width = int(frame_width * scale)
-                    new_height = int(frame_height * scale)
-                    frame = cv2.resize(frame, (new_width, new_height))
-                    
-                    # Convert to RGB
-                    frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    
-                    # Convert to PIL Image and then to PhotoImage
-                    image = Image.fromarray(frame)
-                    photo = ImageTk.PhotoImage(image)
-                    
-                    # Update label in main thread
-                    self.root.after(0, lambda: self.update_camera2_display(photo))
-                else:
-                    break
-            except Exception as e:
-                print(f"Camera 2 error: {e}")
-                break
+    def prepare_display(self, cap, frame):
+        """Scale a BGR frame to the display size and encode it as a binary PPM"""
+        # Get display size
+        display_width, display_height = self.display_size
         
-        self.root.after(0, lambda: self.camera2_label.config(text="Camera 2\nConnection Lost"))
+        if getattr(cap, "output_size", None) is not None:
+            # Frame was already scaled by the decoder
+            cap.set_output_size((display_width, display_height))
+            # Convert to RGB
+            display = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        else:
+            # Resize frame to fit display while maintaining aspect ratio
+            frame_height, frame_width = frame.shape[:2]
+            
+            # Calculate scaling factor
+            scale_w = display_width / frame_width
+            scale_h = display_height / frame_height
+            scale = min(scale_w, scale_h)
+            
+            # Resize frame
+            new_width = int(frame_width * scale)
+            new_height = int(frame_height * scale)
+            if downscale_bgr_to_rgb is not None and scale < 1:
+                # Resize and convert to RGB in a single pass
+                display = np.empty((new_height, new_width, 3), dtype=np.uint8)
+                downscale_bgr_to_rgb(frame, display, *self.get_scale_maps(frame_width, frame_height, new_width, new_height))
+            else:
+                display = cv2.resize(frame, (new_width, new_height))
+                display = cv2.cvtColor(display, cv2.COLOR_BGR2RGB)
+        
+        # Binary PPM that Tk can load straight into the camera's PhotoImage.
+        # join() reads the array's buffer directly, so the RGB pixels are
+        # copied once into the final bytes (tobytes() + concat copied twice).
+        # PhotoImage.put() would need a "#rrggbb" string per pixel built in
+        # Python (~2.3x the bytes plus per-pixel formatting), and
+        # ImageTk.PhotoImage.paste() still converts through PIL, so a raw PPM
+        # payload is the cheapest way into an existing PhotoImage.
+        height, width = display.shape[:2]
+        ppm = b"".join((b"P6 %d %d 255\n" % (width, height), display))
+        return ppm, (width, height)
+    
+    def get_scale_maps(self, frame_width, frame_height, new_width, new_height):
+        """Nearest source column/row for each display pixel, cached until the next resize"""
+        key = (frame_width, frame_height, new_width, new_height)
+        maps = self.scale_maps.get(key)
+        if maps is None:
+            x_map = ((np.arange(new_width) + 0.5) * (frame_width / new_width)).astype(np.int32)
+            y_map = ((np.arange(new_height) + 0.5) * (frame_height / new_height)).astype(np.int32)
+            maps = self.scale_maps[key] = (x_map, y_map)
+        return maps
+    
+    def publish_frame(self, num, frame, ppm, size):
+        """Hand a frame to the UI pump, replacing any frame it has not shown yet"""
+        # read()/retrieve() return a new array each time, so the original frame is
+        # stored by reference and only copied when an image is captured.
+        if num == 1:
+            with self.frame_lock1:
+                self.latest_frame1 = frame
+                self.pending_display1 = (ppm, size)
+        else:
+            with self.frame_lock2:
+                self.latest_frame2 = frame
+                self.pending_display2 = (ppm, size)
+    
+    def show_connection_lost(self, num):
+        """Mark a camera's display as lost in main thread"""
+        if num == 1:
+            self.camera1_canvas.itemconfigure(self.camera1_text, text="Camera 1\nConnection Lost")
+        else:
+            self.camera2_canvas.itemconfigure(self.camera2_text, text="Camera 2\nConnection Lost")
+    
+    def center_camera_items(self, event):
+        """Keep the frame and status text centred when a camera canvas is resized"""
+        for item in event.widget.find_all():
+            event.widget.coords(item, event.width / 2, event.height / 2)
     
-    def update_camera1_display(self, photo):
+    def pump_displays(self):
+        """Show the newest pending frame of each camera, then reschedule (~30 fps)"""
+        with self.frame_lock1:
+            pending1, self.pending_display1 = self.pending_display1, None
+        with self.frame_lock2:
+            pending2, self.pending_display2 = self.pending_display2, None
+        if pending1 is not None:
+            self.update_camera1_display(*pending1)
+        if pending2 is not None:
+            self.update_camera2_display(*pending2)
+        if pending1 is not None or pending2 is not None:
+            # Redraw both cameras in one pass
+            self.root.update_idletasks()
+        self.root.after(33, self.pump_displays)
+    
+    def update_camera1_display(self, ppm, size):
         """Update camera 1 display in main thread"""
-        self.camera1_label.config(image=photo, text="")
-        self.camera1_label.image = photo  # Keep a reference
+        if self.photo1 is None or self.photo1_size != size:
+            # Only allocate a new PhotoImage when the frame size changes
+            self.photo1 = tk.PhotoImage(width=size[0], height=size[1])
+            self.photo1_size = size
+            self.camera1_canvas.itemconfigure(self.camera1_image, image=self.photo1)
+            self.camera1_canvas.itemconfigure(self.camera1_text, text="")
+        self.photo1.configure(data=ppm, format="PPM")
     
-    def update_camera2_display(self, photo):
+    def update_camera2_display(self, ppm, size):
         """Update camera 2 display in main thread"""
-        self.camera2_label.config(image=photo, text="")
-        self.camera2_label.image = photo  # Keep a reference
+        if self.photo2 is None or self.photo2_size != size:
+            # Only allocate a new PhotoImage when the frame size changes
+            self.photo2 = tk.PhotoImage(width=size[0], height=size[1])
+            self.photo2_size = size
+            self.camera2_canvas.itemconfigure(self.camera2_image, image=self.photo2)
+            self.camera2_canvas.itemconfigure(self.camera2_text, text="")
+        self.photo2.configure(data=ppm, format="PPM")
     
     def capture_images(self):
         """Capture images from both cameras using last safe frames"""
@@ -557,25 +969,50 @@ class CameraViewer:
             filename1 = f"{self.captures_dir}/camera1_{timestamp}.jpg"
             filename2 = f"{self.captures_dir}/camera2_{timestamp}.jpg"
             
-            cv2.imwrite(filename1, frame1)
-            cv2.imwrite(filename2, frame2)
+            # Encode both images in parallel off the UI thread
+            futures = [
+                self.io_pool.submit(cv2.imwrite, filename1, frame1),
+                self.io_pool.submit(cv2.imwrite, filename2, frame2),
+            ]
+            self.root.after(50, self.finish_capture, futures, filename1, filename2)
             
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to capture images: {str(e)}")
+    
+    def finish_capture(self, futures, filename1, filename2):
+        """Report the capture result once both images are written"""
+        if not all(future.done() for future in futures):
+            self.root.after(50, self.finish_capture, futures, filename1, filename2)
+            return
+        
+        try:
+            # imwrite reports a failed write by returning False rather than raising
+            failed = [filename for filename, future in zip((filename1, filename2), futures) if not future.result()]
+            if failed:
+                messagebox.showerror("Error", "Failed to write image(s):\n" + "\n".join(failed))
+                return
             messagebox.showinfo("Success", f"Images captured successfully!\nCamera 1: {filename1}\nCamera 2: {filename2}")
-            
         except Exception as e:
             messagebox.showerror("Error", f"Failed to capture images: {str(e)}")
     
-    def on_window_resize(self, event):
-        """Handle window resize events"""
-        # Only handle resize events for the main window
-        if event.widget == self.root:
-            # Trigger a recalculation of display sizes by updating the display size cache
-            pass
+    def on_window_resize(self, width, height):
+        """Handle main window resize events, coalescing a drag into one update"""
+        if self.resize_after is not None:
+            self.root.after_cancel(self.resize_after)
+        self.resize_after = self.root.after(100, self.apply_window_resize, int(width), int(height))
+    
+    def apply_window_resize(self, width, height):
+        """Recalculate display sizes here so stream threads never query Tk"""
+        self.resize_after = None
+        self.display_size = self.get_display_size(width, height)
+        self.scale_maps = {}
     
     def on_closing(self):
         """Handle application closing"""
         self.disconnect_cameras()
         self.disconnect_weighbridge()
+        # Let pending captures finish writing
+        self.io_pool.shutdown(wait=True)
         self.root.destroy()
 
 def main():
@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 import argparse
+import concurrent.futures
+import struct
 import time
 from typing import List, Tuple
 
@@ -8,90 +10,145 @@ from pymodbus.exceptions import ModbusException
 
 # Minimal interpretations for common scales
 
+def pack_registers(registers: List[int]) -> bytes:
+	return struct.pack(f">{len(registers)}H", *registers)
+
+
+def swap_words(values: List[int]) -> List[int]:
+	# Big-endian pairs to little-endian word order (and back): swap the 16-bit halves
+	return [((v & 0xFFFF) << 16) | (v >> 16) for v in values]
+
+
+def to_signed32(values: List[int]) -> List[int]:
+	return [(v ^ 0x80000000) - 0x80000000 for v in values]
+
+
 def decode_u16_list(registers: List[int]) -> List[int]:
 	return [r & 0xFFFF for r in registers]
 
 
 def decode_s16_list(registers: List[int]) -> List[int]:
-	values: List[int] = []
-	for r in registers:
-		v = r & 0xFFFF
-		if v & 0x8000:
-			v = v - 0x10000
-		values.append(v)
-	return values
+	return list(struct.unpack(f">{len(registers)}h", pack_registers(registers)))
 
 
 def decode_u32_pairs(registers: List[int], big_endian: bool = True) -> List[int]:
-	values: List[int] = []
-	for i in range(0, len(registers) - 1, 2):
-		hi, lo = (registers[i], registers[i + 1]) if big_endian else (registers[i + 1], registers[i])
-		values.append(((hi & 0xFFFF) << 16) | (lo & 0xFFFF))
-	return values
+	values = list(struct.unpack_from(f">{len(registers) // 2}I", pack_registers(registers)))
+	return values if big_endian else swap_words(values)
 
 
 def decode_s32_pairs(registers: List[int], big_endian: bool = True) -> List[int]:
-	values: List[int] = []
-	for i in range(0, len(registers) - 1, 2):
-		hi, lo = (registers[i], registers[i + 1]) if big_endian else (registers[i + 1], registers[i])
-		u = ((hi & 0xFFFF) << 16) | (lo & 0xFFFF)
-		if u & 0x80000000:
-			u = u - 0x100000000
-		values.append(u)
-	return values
+	return to_signed32(decode_u32_pairs(registers, big_endian))
 
 
 def pretty_candidates(registers: List[int]) -> str:
-	u16 = decode_u16_list(registers)
-	s16 = decode_s16_list(registers)
-	u32_be = decode_u32_pairs(registers, True)
-	u32_le = decode_u32_pairs(registers, False)
-	s32_be = decode_s32_pairs(registers, True)
-	s32_le = decode_s32_pairs(registers, False)
+	# Decode only the printed head, and derive the other 32-bit views from one pair decode
+	head = registers[:6]
+	u16 = decode_u16_list(head)
+	s16 = decode_s16_list(head)
+	u32_be = decode_u32_pairs(head)
+	u32_le = swap_words(u32_be)
+	s32_be = to_signed32(u32_be)
+	s32_le = to_signed32(u32_le)
 	parts = []
-	parts.append(f"u16={u16[:6]}")
-	parts.append(f"s16={s16[:6]}")
+	parts.append(f"u16={u16}")
+	parts.append(f"s16={s16}")
 	if u32_be:
-		parts.append(f"u32_BE={u32_be[:3]}")
+		parts.append(f"u32_BE={u32_be}")
 	if u32_le:
-		parts.append(f"u32_LE={u32_le[:3]}")
+		parts.append(f"u32_LE={u32_le}")
 	if s32_be:
-		parts.append(f"s32_BE={s32_be[:3]}")
+		parts.append(f"s32_BE={s32_be}")
 	if s32_le:
-		parts.append(f"s32_LE={s32_le[:3]}")
+		parts.append(f"s32_LE={s32_le}")
 	return " | ".join(parts)
 
 
-def probe(client: ModbusSerialClient, units: List[int], address_start: int, address_end: int, counts: List[int], delay: float, kind: str) -> List[Tuple[int, int, int, List[int]]]:
+def probe(client: ModbusSerialClient, units: List[int], address_start: int, address_end: int, counts: List[int], delay: float, kind: str, label: str = "", quiet: bool = False, fast: bool = False) -> List[Tuple[int, int, int, List[int]]]:
 	results = []
+	# Ascending, so an illegal-address reply means every remaining count fails too
+	counts = sorted(set(counts))
+	read_fn = client.read_holding_registers if kind == "holding" else client.read_input_registers
 	for unit in units:
-		for address in range(address_start, address_end + 1):
+		miss_streak = 0
+		address = address_start
+		while address <= address_end:
+			hit = False
+			# Largest block from here the device answered without an illegal-address reply
+			covered = 1
 			for count in counts:
+				# Reads past the last register (0xFFFF) can never succeed
+				if address + count > 0x10000:
+					break
+				illegal_address = False
+				# Space request starts by delay; time spent waiting on the reply counts towards it
+				deadline = time.monotonic() + delay
 				try:
-					if kind == "holding":
-						resp = client.read_holding_registers(address=address, count=count, unit=unit)
-					else:
-						resp = client.read_input_registers(address=address, count=count, unit=unit)
-					if hasattr(resp, 'isError') and not resp.isError() and hasattr(resp, 'registers') and resp.registers:
-						results.append((unit, address, count, resp.registers))
-						print(f"OK unit={unit} addr={address} count={count} -> {resp.registers[:6]} | {pretty_candidates(resp.registers)}")
+					resp = read_fn(address=address, count=count, unit=unit)
+					try:
+						is_err = resp.isError()
+						regs = resp.registers
+					except AttributeError:
+						# Exception responses have no registers
+						is_err, regs = True, None
+					if not is_err and regs:
+						hit = True
+						results.append((unit, address, count, regs))
+						if quiet:
+							print(f"{label}OK unit={unit} addr={address} count={count}")
+						else:
+							print(f"{label}OK unit={unit} addr={address} count={count} -> {regs[:6]} | {pretty_candidates(regs)}")
 					else:
 						# Uncomment to see errors/no data
 						# print(f"ERR unit={unit} addr={address} count={count} -> {resp}")
-						pass
+						illegal_address = getattr(resp, 'exception_code', None) == 0x02
+						if not illegal_address:
+							covered = count
 				except ModbusException as e:
 					# print(f"ModbusException unit={unit} addr={address} count={count}: {e}")
 					pass
 				except Exception:
 					# Serial timeouts etc.
 					pass
-				time.sleep(delay)
+				time.sleep(max(0.0, deadline - time.monotonic()))
+				if illegal_address:
+					break
+			miss_streak = 0 if hit else miss_streak + 1
+			if fast and miss_streak > 8:
+				# A failed block read does not prove the rest of the block is empty, so this
+				# may miss registers; only done when asked for with --fast
+				address += covered
+				miss_streak = 0
+			else:
+				address += 1
 	return results
 
 
+def probe_port(port: str, args: argparse.Namespace, units: List[int], addr_lo: int, addr_hi: int, counts: List[int], label: str = "") -> List[Tuple[int, int, int, List[int]]]:
+	client = ModbusSerialClient(
+		method='rtu',
+		port=port,
+		baudrate=args.baudrate,
+		parity=args.parity,
+		stopbits=args.stopbits,
+		bytesize=args.bytesize,
+		timeout=args.timeout,
+	)
+
+	if not client.connect():
+		print(f"Failed to connect on {port} @ {args.baudrate}bps")
+		return []
+
+	print(f"Connected on {port}. Scanning units={units}, addr={addr_lo}-{addr_hi}, counts={counts}, kind={args.kind}")
+	try:
+		return probe(client, units, addr_lo, addr_hi, counts, args.delay, args.kind, label, args.quiet, args.fast)
+	finally:
+		client.close()
+		print(f"Disconnected {port}")
+
+
 def main():
 	parser = argparse.ArgumentParser(description="Probe Modbus RTU device to discover unit/address/count for registers")
-	parser.add_argument("--port", default="/dev/ttyUSB0", help="Serial port, e.g., /dev/ttyUSB0 or COM3")
+	parser.add_argument("--port", default="/dev/ttyUSB0", help="Serial port, or comma-separated ports to scan in parallel, e.g., /dev/ttyUSB0 or COM3,COM4")
 	parser.add_argument("--baudrate", type=int, default=9600, help="Baud rate")
 	parser.add_argument("--parity", default="N", choices=["N", "E", "O"], help="Parity")
 	parser.add_argument("--stopbits", type=int, default=1, choices=[1, 2], help="Stop bits")
@@ -102,6 +159,8 @@ def main():
 	parser.add_argument("--counts", default="1,2,4,8", help="Comma-separated counts to try, e.g., 1,2,4")
 	parser.add_argument("--delay", type=float, default=0.05, help="Delay between requests in seconds")
 	parser.add_argument("--kind", default="holding", choices=["holding", "input"], help="Register type to read")
+	parser.add_argument("--quiet", action="store_true", help="Only print where registers were found, without decoding them")
+	parser.add_argument("--fast", action="store_true", help="After 8 empty addresses in a row, skip ahead by the largest block the device answered (may miss registers)")
 	args = parser.parse_args()
 
 	def parse_units(units_str: str) -> List[int]:
@@ -113,6 +172,9 @@ def main():
 				units.extend(range(int(lo), int(hi) + 1))
 			else:
 				units.append(int(part))
+		# Usually a single id or range, which is already sorted and unique
+		if all(a < b for a, b in zip(units, units[1:])):
+			return units
 		return sorted(set(units))
 
 	def parse_range(rng: str) -> Tuple[int, int]:
@@ -126,26 +188,16 @@ def main():
 	addr_lo, addr_hi = parse_range(args.addr_range)
 	counts = parse_counts(args.counts)
 
-	client = ModbusSerialClient(
-		method='rtu',
-		port=args.port,
-		baudrate=args.baudrate,
-		parity=args.parity,
-		stopbits=args.stopbits,
-		bytesize=args.bytesize,
-		timeout=args.timeout,
-	)
+	ports = [p.strip() for p in args.port.split(',') if p.strip()]
 
-	if not client.connect():
-		print(f"Failed to connect on {args.port} @ {args.baudrate}bps")
+	# Requests on one bus must go out one at a time; separate ports are scanned concurrently
+	if len(ports) == 1:
+		probe_port(ports[0], args, units, addr_lo, addr_hi, counts)
 		return
-
-	print(f"Connected on {args.port}. Scanning units={units}, addr={addr_lo}-{addr_hi}, counts={counts}, kind={args.kind}")
-	try:
-		probe(client, units, addr_lo, addr_hi, counts, args.delay, args.kind)
-	finally:
-		client.close()
-		print("Disconnected")
+	with concurrent.futures.ThreadPoolExecutor(max_workers=len(ports)) as pool:
+		futures = [pool.submit(probe_port, port, args, units, addr_lo, addr_hi, counts, f"[{port}] ") for port in ports]
+		for future in futures:
+			future.result()
 
 if __name__ == "__main__":
 	main()
@@ -1,13 +1,14 @@
 #!/usr/bin/env python3
 import argparse
+import binascii
+import select
 import sys
 import time
 import serial
 
 ASCII_SAFE = set(range(32, 127)) | {9, 10, 13}
-
-def to_ascii(data: bytes) -> str:
-	return ''.join(chr(b) if b in ASCII_SAFE else '.' for b in data)
+# bytes.translate table: safe bytes map to themselves, everything else to '.'
+ASCII_TABLE = bytes(b if b in ASCII_SAFE else ord('.') for b in range(256))
 
 
 def main():
@@ -36,21 +37,40 @@ def main():
 
 	print(f"Opened {args.port} @ {args.baudrate},{args.bytesize}{args.parity}{args.stopbits}")
 	print("Press Ctrl+C to stop.")
+	# Chunks go straight to the binary buffer; flush the text layer first to keep the order
+	sys.stdout.flush()
+	out = sys.stdout.buffer
+	chunk_end = b"\n\n" if args.newline else b"\n"
+	# Windows serial handles cannot be passed to select()
+	use_select = sys.platform != "win32"
+	# A zero timeout would make select() return at once and spin; block until data instead
+	select_timeout = args.timeout if args.timeout > 0 else None
 	try:
 		while True:
-			data = ser.read(256)
-			if data:
-				hex_str = ' '.join(f"0x{b:02x}" for b in data)
-				ascii_str = to_ascii(data)
-				print(f"HEX: {hex_str}")
-				print(f"ASCII: {ascii_str}")
-				if args.newline:
-					print()
+			if use_select:
+				# Sleep until the port is readable (up to timeout), then take everything queued
+				ready, _, _ = select.select([ser.fileno()], [], [], select_timeout)
+				data = ser.read(ser.in_waiting or 1) if ready else b""
 			else:
-				time.sleep(0.05)
+				waiting = ser.in_waiting
+				data = ser.read(waiting) if waiting else b""
+			if data:
+				extra = ser.in_waiting
+				if extra:
+					data += ser.read(extra)
+				# hexlify only takes a one-character separator, so add the 0x prefixes afterwards;
+				# both lines stay bytes all the way to the binary stdout buffer
+				hex_bytes = b'0x' + binascii.hexlify(data, b' ').replace(b' ', b' 0x')
+				out.write(b"HEX: " + hex_bytes + b"\nASCII: " + data.translate(ASCII_TABLE) + chunk_end)
+				# Flush once caught up with the port; while bytes keep queuing, let the buffer fill
+				if not ser.in_waiting:
+					out.flush()
+			elif not use_select:
+				time.sleep(0.01)
 	except KeyboardInterrupt:
 		pass
 	finally:
+		out.flush()
 		ser.close()
 		print("Closed")
 